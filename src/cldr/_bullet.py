@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 import re
-from typing import List, Type, TypeVar, cast
+import sys
+from typing import List, Optional, Type, TypeVar, cast
 
 from eris import ErisError, Err, Ok, Result
-from pydantic.dataclasses import dataclass
 from typist import PathLike, literal_to_list
 
 from ._config import Config
@@ -17,23 +18,54 @@ from ._tags import TAG_TYPES, Tag
 
 Bullet_T = TypeVar("Bullet_T", bound="Bullet")
 
-
-class BulletConfig:
-    """TODO"""
-
-    arbitrary_types_allowed = True
-
-
-@dataclass(frozen=True, config=BulletConfig)
+_SORTED_KINDS = sorted(cast(List[Kind], literal_to_list(Kind)))
+
+# NOTE: The tag group is captured verbatim and each of its comma-separated
+#   tags is classified separately by _TAG_DISPATCH_RE.
+_BULLET_PATTERN = (
+    r"^[*-][ ]*(?P<kind>[a-z]+)"
+    r"[ ]*(?:\((?P<tags>[^)]+)\))?[ ]*:"
+    r"[ ]*(?P<body>.*)$"
+)
+_BULLET_RE = re.compile(_BULLET_PATTERN)
+_TAG_DISPATCH_RE = re.compile(
+    "|".join(
+        f"(?P<t{i}>{tag_type.regexp})" for i, tag_type in enumerate(TAG_TYPES)
+    )
+)
+_TAG_BY_GROUP = {f"t{i}": tag_type for i, tag_type in enumerate(TAG_TYPES)}
+_TAG_BY_LEADING_CHAR = {
+    char: (tag_type, tag_type.compiled_regexp.fullmatch)
+    for tag_type in TAG_TYPES
+    for char in tag_type.leading_chars
+}
+
+
+@dataclass(frozen=True)
 class Bullet:
     """TODO"""
 
+    __slots__ = (
+        "cfg",
+        "line",
+        "changelog_dir",
+        "kind",
+        "tags",
+        "body",
+        "bullet_file",
+        "line_number",
+    )
+
     cfg: Config
     line: str
     changelog_dir: Path
     kind: Kind
     tags: List[Tag]
     body: str
+    # The bullet file this bullet was read from and its (0-based) line number
+    # in that file, if known.
+    bullet_file: Optional[Path]
+    line_number: Optional[int]
 
     @classmethod
     def from_string(
@@ -41,44 +73,42 @@ class Bullet:
         cfg: Config,
         line: str,
         changelog_dir: PathLike = "changelog",
+        *,
+        bullet_file: Optional[Path] = None,
+        line_number: Optional[int] = None,
     ) -> Result["Bullet_T", ErisError]:
         """TODO"""
-        changelog_dir = Path(changelog_dir)
+        if not isinstance(changelog_dir, Path):
+            changelog_dir = Path(changelog_dir)
 
-        _TAG_PATTERN = "(?:{})".format(
-            "|".join(
-                "(?:{})".format(tag_type.regexp) for tag_type in TAG_TYPES
-            )
-        )
-        BULLET_PATTERN = (
-            r"^[*-][ ]*(?P<kind>[a-z]+)"
-            r"[ ]*(?:\((?P<tags>{0}(?:,{0})*)\))?[ ]*:"
-            r"[ ]*(?P<body>.*)$"
-        ).format(_TAG_PATTERN)
-
-        if m := re.match(BULLET_PATTERN, line):
-            kind = cast(Kind, m.group("kind").lower())
+        if m := _BULLET_RE.match(line):
+            kind = cast(Kind, sys.intern(m.group("kind").lower()))
             if kind not in KIND_TO_SECTION_MAP:
                 return Err(
                     f"An invalid bullet kind ({kind!r}) was detected in the"
                     f" following line:\n\n{line!r}\n\nUse one of the following"
                     " supported bullet types instead:"
-                    f" {sorted(cast(List[Kind], literal_to_list(Kind)))}"
+                    f" {_SORTED_KINDS}"
                 )
 
             tags_group = m.group("tags")
             raw_tag_list = tags_group.split(",") if tags_group else []
             tags: List[Tag] = []
             for raw_tag in raw_tag_list:
-                for tag_type in TAG_TYPES:
-                    if re.match(tag_type.regexp, raw_tag):
-                        tags.append(tag_type(raw_tag))
-                        break
+                tag_hint = _TAG_BY_LEADING_CHAR.get(raw_tag[:1])
+                if tag_hint is not None and tag_hint[1](raw_tag):
+                    tag_type = tag_hint[0]
                 else:
-                    return Err(
-                        "The following tag does not match any known tag"
-                        f" types: {raw_tag!r}"
-                    )
+                    tag_m = _TAG_DISPATCH_RE.fullmatch(raw_tag)
+                    if tag_m is None or tag_m.lastgroup is None:
+                        return Err(
+                            "The following tag does not match any known tag"
+                            f" types: {raw_tag!r}"
+                        )
+
+                    tag_type = _TAG_BY_GROUP[tag_m.lastgroup]
+
+                tags.append(tag_type(raw_tag))
 
             return Ok(
                 cls(
@@ -88,6 +118,8 @@ class Bullet:
                     kind,
                     tags,
                     m.group("body"),
+                    bullet_file,
+                    line_number,
                 )
             )
         else:
@@ -103,5 +135,4 @@ class Bullet:
         for tag in self.tags:
             result = tag.transform_bullet(self, result).unwrap()
 
-        result += "\n"
-        return result
+        return result + "\n"
@@ -36,6 +36,8 @@ Examples:
 #   clack parser function.
 from __future__ import annotations
 
+import argparse
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, List, Literal, Optional, Sequence
 
@@ -54,6 +56,9 @@ Command = Literal[
     BuildCommand, BumpCommand, InfoCommand, NewCommand
 ]  # available CLI sub-commands
 
+_BUMP_CHOICES = literal_to_list(BumpPart)
+_KIND_CHOICES = literal_to_list(Kind)
+
 
 class Config(clack.Config):
     """Base configuration class."""
@@ -118,6 +123,17 @@ class NewConfig(Config):
 
 def clack_parser(argv: Sequence[str]) -> dict[str, Any]:
     """TODO"""
+    parser = _build_parser()
+    args = parser.parse_args(argv[1:])
+    kwargs = clack.filter_cli_args(args)
+
+    return kwargs
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    # NOTE: The parser only depends on this module and the Config classes
+    #   defined above, so it is safe to build it once and reuse it.
     parser = clack.Parser()
     parser.add_argument(
         "--changelog-dir",
@@ -168,14 +184,13 @@ def clack_parser(argv: Sequence[str]) -> dict[str, Any]:
         ),
     )
 
-    choices = literal_to_list(BumpPart)
     bump_parser.add_argument(
         "part",
         metavar="PART",
-        choices=choices,
+        choices=_BUMP_CHOICES,
         help=(
             "The part of the semantic version to bump forward. Choose from"
-            f" one of {choices}."
+            f" one of {_BUMP_CHOICES}."
         ),
     )
 
@@ -201,14 +216,13 @@ def clack_parser(argv: Sequence[str]) -> dict[str, Any]:
         help="Add a new bullet to the KIND section of the next release.",
     )
 
-    choices = literal_to_list(Kind)
     new_parser.add_argument(
         "kind",
         metavar="KIND",
-        choices=choices,
+        choices=_KIND_CHOICES,
         help=(
             "This is the type (aka KIND) of the changelog bullet that will be"
-            f" added. Choose from one of {choices}."
+            f" added. Choose from one of {_KIND_CHOICES}."
         ),
     )
 
@@ -249,7 +263,4 @@ def clack_parser(argv: Sequence[str]) -> dict[str, Any]:
         ),
     )
 
-    args = parser.parse_args(argv[1:])
-    kwargs = clack.filter_cli_args(args)
-
-    return kwargs
+    return parser
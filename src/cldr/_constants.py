@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Dict, Final, Literal
+from typing import Dict, Final, Literal, Tuple
 
 
 AddKind = Literal["add"]
@@ -32,9 +32,14 @@ KIND_TO_SECTION_MAP: Final[Dict[Kind, str]] = {
     "sec": "Security",
 }
 
-BULLET_EXPLANATION = f"""\
+# The order that the release subsections (e.g. '### Added') are written in.
+KIND_SECTION_ORDER: Final[Tuple[Kind, ...]] = tuple(
+    sorted(KIND_TO_SECTION_MAP, key=KIND_TO_SECTION_MAP.__getitem__)
+)
+
+BULLET_EXPLANATION = """\
 All bullet lines must be of the form `* KIND(TAG_LIST): BODY` or `* KIND:
-BODY`, where `KIND` is one of `{sorted(set(KIND_TO_SECTION_MAP))}`, `BODY` is a
+BODY`, where `KIND` is one of `['add', 'chg', 'dep', 'fix', 'misc', 'rm', 'sec']`, `BODY` is a
 sentence or two about the changes you made, `TAG_LIST` is one or more `TAG`s
 separated by commas, and `TAG` is one of `'bc'` (to indicate a breaking
 change), `GITHUB_ISSUE`, `GITHUB_PR`, `JIRA_ISSUE`, or `RELATIVE_COMMIT`.
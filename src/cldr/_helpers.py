@@ -4,12 +4,10 @@ from __future__ import annotations
 
 from collections import defaultdict
 from functools import lru_cache
-import itertools as it
-from operator import attrgetter
 import os
 from pathlib import Path
 import re
-from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Tuple
 
 from clack.types import ClackConfigFile
 from eris import ErisError, Err, Ok, Result
@@ -26,16 +24,17 @@ if TYPE_CHECKING:
 
 logger = Logger(__name__)
 
+_VERSION_RE = re.compile(r"^##[ ]*\[(?P<version>.*)\]")
+
 
 def get_version(line: str) -> Result[str, ErisError]:
     """TODO"""
-    pttrn = r"^##[ ]*\[(?P<version>.*)\]"
-    if m := re.search(pttrn, line):
+    if m := _VERSION_RE.search(line):
         return Ok(m.group("version"))
     else:
         return Err(
             "This regular expression does not match this line.\n\nPATTERN:"
-            f" {pttrn!r}\nLINE: {line!r}"
+            f" {_VERSION_RE.pattern!r}\nLINE: {line!r}"
         )
 
 
@@ -58,24 +57,26 @@ def read_bullets_from_changelog_dir(
     if not cfg.changelog_dir.exists():
         return Err("The changelog directory does not exist.")
 
-    bullet_lines: Iterable[str] = []
-    for path in iter_bullet_files(cfg.changelog_dir):
-        logger.info("Consuming bullets from the %s file...", path)
-        bullet_lines = it.chain(bullet_lines, path.read_text().split("\n"))
-
-    if not bullet_lines:
+    bullet_files = list(iter_bullet_files(cfg.changelog_dir))
+    if not bullet_files:
         return Err(
             "No markdown files were found in the 'changelog' directory (not"
             " including the README.md file)."
         )
 
     kind_to_bullets_map = defaultdict(list)
-    for line in bullet_lines:
+    for path, line_number, line in _iter_bullet_lines(bullet_files):
         line = line.strip()
         if not line:
             continue
 
-        bullet_r = Bullet.from_string(cfg, line, cfg.changelog_dir)
+        bullet_r = Bullet.from_string(
+            cfg,
+            line,
+            cfg.changelog_dir,
+            bullet_file=path,
+            line_number=line_number,
+        )
         if isinstance(bullet_r, Err):
             err: Err[Any, ErisError] = Err(
                 "There was a problem parsing one of the changelog"
@@ -89,28 +90,58 @@ def read_bullets_from_changelog_dir(
     return Ok(kind_to_bullets_map)
 
 
+def _iter_bullet_lines(
+    bullet_files: Iterable[Path],
+) -> Iterator[Tuple[Path, int, str]]:
+    for path in bullet_files:
+        logger.info("Consuming bullets from the %s file...", path)
+        with path.open() as f:
+            for line_number, line in enumerate(f):
+                yield path, line_number, line
+
+
 def iter_bullet_files(changelog_dir: PathLike) -> Iterator[Path]:
     """TODO"""
-    changelog_dir = Path(changelog_dir)
+    if not os.path.isdir(changelog_dir):
+        return
 
-    for path in changelog_dir.glob("*.md"):
-        if path.stem != "README":
-            yield path
+    with os.scandir(changelog_dir) as entries:
+        for entry in entries:
+            if (
+                entry.name.endswith(".md")
+                and entry.name != "README.md"
+                and entry.is_file()
+            ):
+                yield Path(entry.path)
 
 
 def get_editor_cmd_list(*, line: int, column: int) -> list[str]:
     """TODO"""
+    cmd_prefix = _get_editor_cmd_prefix()
+    if "vim" in cmd_prefix[0]:
+        return [*cmd_prefix, f"call cursor({line}, {column})"]
+    else:
+        return list(cmd_prefix)
+
+
+@lru_cache(maxsize=None)
+def _get_editor_cmd_prefix() -> Tuple[str, ...]:
     editor = os.environ.get("EDITOR", "vim")
-    cmd_list = [editor]
     if "vim" in editor:
-        cmd_list.append("+startinsert")
-        cmd_list.extend(["-c", f"call cursor({line}, {column})"])
-    return cmd_list
+        return (editor, "+startinsert", "-c")
+    else:
+        return (editor,)
 
 
-@lru_cache
+@lru_cache(maxsize=None)
 def get_user() -> str:
     """TODO"""
+    # git prefers these envvars over the 'user.email' option when it
+    # determines who the author / committer of a commit is.
+    for envvar in ["GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"]:
+        if email := os.environ.get(envvar):
+            return email.split("@")[0]
+
     git_cmd_list = ["git", "config", "--get", "user.email"]
     out_err_r = proctor.safe_popen(git_cmd_list)
     if isinstance(out_err_r, Err):
@@ -126,9 +157,14 @@ def get_user() -> str:
     return user
 
 
-@lru_cache
+@lru_cache(maxsize=None)
 def get_branch() -> str:
     """TODO"""
+    # GitHub Actions sets this envvar to the PR's source branch (the checkout
+    # itself is usually in a detached HEAD state).
+    if branch := os.environ.get("GITHUB_HEAD_REF"):
+        return branch
+
     branch, _err = proctor.safe_popen(
         ["git", "branch", "--show-current"]
     ).unwrap()
@@ -140,18 +176,17 @@ def get_info(cfg: Config) -> dict[str, Any]:
     result: Dict[str, Any] = {}
 
     result["bullets"] = []
-    if list(iter_bullet_files(cfg.changelog_dir)):
+    if any(iter_bullet_files(cfg.changelog_dir)):
         kind_to_bullets_map = read_bullets_from_changelog_dir(cfg).unwrap()
-        bullets = it.chain.from_iterable(kind_to_bullets_map.values())
-
-        for bullet in sorted(bullets, key=attrgetter("kind")):
-            result["bullets"].append(
-                dict(
-                    kind=bullet.kind,
-                    body=bullet.body,
-                    tags=[tag.tag for tag in bullet.tags],
+        for kind in sorted(kind_to_bullets_map):
+            for bullet in kind_to_bullets_map[kind]:
+                result["bullets"].append(
+                    dict(
+                        kind=bullet.kind,
+                        body=bullet.body,
+                        tags=[tag.tag for tag in bullet.tags],
+                    )
                 )
-            )
     else:
         logger.warning("No bullet files found.")
 
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 import datetime as dt
 import json
 from pathlib import Path
 import subprocess as sp
 import sys
-from typing import List, Optional
+from typing import ContextManager, List, Optional, TextIO
 
 from clack.types import ClackRunner
 from eris import Err
@@ -15,7 +16,12 @@ from logrus import Logger
 import proctor
 
 from ._config import BuildConfig, BumpConfig, InfoConfig, NewConfig
-from ._constants import KIND_TO_SECTION_MAP, README_CONTENTS, UNRELEASED_BEGIN
+from ._constants import (
+    KIND_SECTION_ORDER,
+    KIND_TO_SECTION_MAP,
+    README_CONTENTS,
+    UNRELEASED_BEGIN,
+)
 from ._helpers import (
     get_branch,
     get_editor_cmd_list,
@@ -29,6 +35,13 @@ from ._helpers import (
 
 logger = Logger(__name__)
 
+_UNRELEASED_TITLE = "## [Unreleased]"
+# Matches both the '## [Unreleased](...)' and '## Unreleased' header forms.
+_UNRELEASED_PREFIXES = (
+    _UNRELEASED_TITLE,
+    _UNRELEASED_TITLE.replace("[", "").replace("]", ""),
+)
+
 # The ALL_RUNNERS list is populated later by the `register_tag` decorator.
 ALL_RUNNERS: List[ClackRunner] = []
 
@@ -42,10 +55,7 @@ def register_runner(runner: ClackRunner) -> ClackRunner:
 @register_runner
 def run_build(cfg: BuildConfig) -> int:
     """Clack runner for the 'build' subcommand."""
-    UNRELEASED_TITLE = "## [Unreleased]"
-
     unreleased_section_start: Optional[int] = None
-    unreleased_section_end: Optional[int] = None
     kind_to_bullets_map_r = read_bullets_from_changelog_dir(cfg)
     if isinstance(kind_to_bullets_map_r, Err):
         e = kind_to_bullets_map_r.err()
@@ -59,48 +69,52 @@ def run_build(cfg: BuildConfig) -> int:
 
     kind_to_bullets_map = kind_to_bullets_map_r.ok()
 
-    for i, line in enumerate(cfg.changelog.open()):
-        line = line.strip()
-        if line.startswith(
-            (
-                UNRELEASED_TITLE,
-                "".join(c for c in UNRELEASED_TITLE if c not in ["[", "]"]),
-            )
-        ):
-            unreleased_section_start = i
-            continue
-
-        if unreleased_section_start is None:
-            continue
-
-        if line.startswith("#"):
-            unreleased_section_end = i
-            break
+    old_lines: List[str] = []
+    # The header that follows the unreleased section (if one exists) and the
+    # rest of the changelog, starting with that header.
+    next_header: Optional[str] = None
+    old_tail = ""
+    with cfg.changelog.open() as f:
+        for i, line in enumerate(f):
+            stripped_line = line.strip()
+            if stripped_line.startswith(_UNRELEASED_PREFIXES):
+                unreleased_section_start = i
+            elif (
+                unreleased_section_start is not None
+                and stripped_line.startswith("#")
+            ):
+                # Everything from here on is copied over verbatim, so there
+                # is no need to split it into lines.
+                next_header = line
+                old_tail = line + f.read()
+                break
+
+            old_lines.append(line)
 
     if unreleased_section_start is None:
         logger.error(
             "No unreleased section found in %s. The unreleased section should"
             " have the following form: '%s(%s/compare/X.Y.Z...HEAD)'",
             cfg.changelog,
-            UNRELEASED_TITLE,
+            _UNRELEASED_TITLE,
             cfg.github_repo,
         )
         return 1
 
-    old_lines = cfg.changelog.read_text().split("\n")
-
-    new_contents = "\n".join(old_lines[:unreleased_section_start]) + "\n"
-    new_contents += "{}({}/compare/{}...HEAD)\n".format(
-        UNRELEASED_TITLE, cfg.github_repo, cfg.new_version
+    new_parts: List[str] = old_lines[:unreleased_section_start]
+    new_parts.append(
+        "{}({}/compare/{}...HEAD)\n".format(
+            _UNRELEASED_TITLE, cfg.github_repo, cfg.new_version
+        )
     )
-    new_contents += (
+    new_parts.append(
         f"\n{UNRELEASED_BEGIN(cfg.changelog_dir.name, cfg.github_repo)}\n\n"
     )
 
-    if unreleased_section_end is None:
+    if next_header is None:
         new_version_url = f"{cfg.github_repo}/releases/tag/{cfg.new_version}"
     else:
-        old_version_r = get_version(old_lines[unreleased_section_end])
+        old_version_r = get_version(next_header)
         if isinstance(old_version_r, Err):
             e = old_version_r.err()
             logger.error(
@@ -117,30 +131,33 @@ def run_build(cfg: BuildConfig) -> int:
 
     version_part = f"[{cfg.new_version}]({new_version_url})"
     date_part = dt.datetime.today().strftime("%Y-%m-%d")
-    new_contents += f"## {version_part} - {date_part}\n\n"
+    new_parts.append(f"## {version_part} - {date_part}\n\n")
 
     first_subsection = True
-    for kind in sorted(
-        KIND_TO_SECTION_MAP, key=lambda x: KIND_TO_SECTION_MAP[x]
-    ):
+    for kind in KIND_SECTION_ORDER:
         if kind in kind_to_bullets_map:
             if first_subsection:
                 first_subsection = False
             else:
-                new_contents += "\n"
-
-            new_contents += f"### {KIND_TO_SECTION_MAP[kind]}\n\n"
+                new_parts.append("\n")
 
-            for bullet in kind_to_bullets_map[kind]:
-                new_contents += bullet.to_string()
+            new_parts.append(f"### {KIND_TO_SECTION_MAP[kind]}\n\n")
+            new_parts.extend(
+                bullet.to_string() for bullet in kind_to_bullets_map[kind]
+            )
 
-    if unreleased_section_end is not None:
-        new_contents += "\n\n"
-        new_contents += "\n".join(old_lines[unreleased_section_end:])
+    if next_header is not None:
+        new_parts.append("\n\n")
+        new_parts.append(old_tail)
 
-    out_file = cfg.changelog.open("w") if cfg.in_place else sys.stdout
-    out_file.write(new_contents)
-    out_file.close()
+    out_file_ctx: ContextManager[TextIO]
+    if cfg.in_place:
+        out_file_ctx = cfg.changelog.open("w")
+    else:
+        # Don't close stdout on the way out.
+        out_file_ctx = nullcontext(sys.stdout)
+    with out_file_ctx as out_file:
+        out_file.write("".join(new_parts))
 
     # Delete the bullet files if the --in-place option was given...
     if cfg.in_place:
@@ -198,7 +215,7 @@ def run_new(cfg: NewConfig) -> int:
     )
 
     old_lines = (
-        bullet_file.read_text().split("\n") if bullet_file.exists() else []
+        bullet_file.read_text().splitlines() if bullet_file.exists() else []
     )
     bullet_line = "* {}{}: {}".format(
         cfg.kind,
@@ -220,9 +237,15 @@ def run_new(cfg: NewConfig) -> int:
         ps = sp.Popen(editor_cmd_list)
         ps.communicate()
 
-    new_lines = (
-        bullet_file.read_text().split("\n") if bullet_file.exists() else []
-    )
+        new_lines = (
+            bullet_file.read_text().splitlines()
+            if bullet_file.exists()
+            else []
+        )
+    else:
+        # We know exactly what was appended, so there is no need to re-read
+        # the bullet file.
+        new_lines = old_lines + bullet_line.splitlines()
     if cfg.commit_changes and old_lines != new_lines:
         git_add_files = [str(f) for f in git_add_paths]
         logger.info(
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 from abc import ABC
-from pathlib import Path
+from functools import lru_cache
 import re
 from typing import (
     TYPE_CHECKING,
     List,
-    Optional,
+    Pattern,
     Protocol,
     Type,
     runtime_checkable,
@@ -17,8 +17,6 @@ from typing import (
 from eris import ErisError, Err, Ok, Result
 import proctor
 
-from ._helpers import iter_bullet_files
-
 
 if TYPE_CHECKING:
     from ._bullet import Bullet
@@ -32,6 +30,8 @@ TAG_TYPES: List[Type["Tag"]] = []
 class Tag(Protocol):
     """TODO"""
 
+    compiled_regexp: Pattern[str]
+    leading_chars: str
     regexp: str
     tag: str
 
@@ -47,12 +47,22 @@ class Tag(Protocol):
 class TagMixin(ABC):
     """TODO"""
 
+    # Characters that a tag of this type can start with. These are only used
+    # as a hint to skip the full tag-type regex scan, so they MUST NOT be set
+    # on a tag type whose tags can also be matched by a tag type that was
+    # registered before it.
+    leading_chars = ""
+
+    # Set by the `register_tag` decorator.
+    compiled_regexp: Pattern[str]
+
     def __init__(self, tag: str) -> None:
         self.tag = tag
 
 
 def register_tag(tag_type: Type[Tag]) -> Type[Tag]:
     """TODO"""
+    tag_type.compiled_regexp = re.compile(tag_type.regexp)
     TAG_TYPES.append(tag_type)
     return tag_type
 
@@ -61,6 +71,7 @@ def register_tag(tag_type: Type[Tag]) -> Type[Tag]:
 class BreakingChangeTag(TagMixin):
     """TODO"""
 
+    leading_chars = "b"
     regexp = r"bc"
 
     @staticmethod
@@ -81,10 +92,15 @@ class BreakingChangeTag(TagMixin):
         return Ok("* *BREAKING CHANGE*: " + bullet_line[2:])
 
 
+# Matches GitHub tags of the form `CN`, `REPO` + `CN`, or `ORG/REPO` + `CN`,
+# where C is the tag type's special character (e.g. '#') and N is a number.
+_GITHUB_TAG_SHAPE = (
+    r"{c}[1-9][0-9]*|[^/{c}]+{c}[1-9][0-9]*|[^/{c}]+/[^/{c}]+{c}[1-9][0-9]*"
+)
+
+
 def _github_tag_regexp(char: str) -> str:
-    return r"{0}{1}|{2}{0}{1}|{2}/{2}{0}{1}".format(
-        char, "[1-9][0-9]*", f"[^/{char}]+"
-    )
+    return _GITHUB_TAG_SHAPE.format(c=re.escape(char))
 
 
 def _github_tag_transform_bullet(
@@ -96,18 +112,17 @@ def _github_tag_transform_bullet(
     *,
     prefix: str = "",
 ) -> str:
-    if tag.startswith(char):
-        url = f"{github_repo}/{url_node}/{tag.replace(char, '')}"
-    elif "/" in tag:
-        github_url = "/".join(github_repo.split("/")[:-2])
-        org_and_repo, N = tag.split(char)
-        url = f"{github_url}/{org_and_repo}/{url_node}/{N}"
+    repo_part, _, N = tag.partition(char)
+    if not repo_part:
+        url = f"{github_repo}/{url_node}/{N}"
+    elif "/" in repo_part:
+        github_url = github_repo.rsplit("/", 2)[0]
+        url = f"{github_url}/{repo_part}/{url_node}/{N}"
     else:
-        github_org_url = "/".join(github_repo.split("/")[:-1])
-        repo_name, N = tag.split(char)
-        url = f"{github_org_url}/{repo_name}/{url_node}/{N}"
+        github_org_url = github_repo.rsplit("/", 1)[0]
+        url = f"{github_org_url}/{repo_part}/{url_node}/{N}"
 
-    issue_link = f"[{prefix}{tag.replace(char, '#')}]({url})"
+    issue_link = f"[{prefix}{repo_part}#{N}]({url})"
     return _add_tag_to_paren_group(bullet_line, issue_link)
 
 
@@ -115,6 +130,7 @@ def _github_tag_transform_bullet(
 class GithubIssue(TagMixin):
     """TODO"""
 
+    leading_chars = "#"
     regexp = _github_tag_regexp("#")
 
     def transform_bullet(
@@ -131,6 +147,7 @@ class GithubIssue(TagMixin):
 class GithubPullRequest(TagMixin):
     """TODO"""
 
+    leading_chars = "!"
     regexp = _github_tag_regexp("!")
 
     def transform_bullet(
@@ -152,6 +169,7 @@ class GithubPullRequest(TagMixin):
 class JiraIssue(TagMixin):
     """TODO"""
 
+    leading_chars = "123456789"
     regexp = r"(?:[A-Za-z]+-)?[1-9][0-9]*"
 
     def transform_bullet(
@@ -188,44 +206,27 @@ class JiraIssue(TagMixin):
 class RelativeCommitTag(TagMixin):
     """TODO"""
 
+    leading_chars = "c"
     regexp = r"c(?:0|[1-9][0-9]*)"
 
     def transform_bullet(
         self, bullet: Bullet, bullet_line: str
     ) -> Result[str, ErisError]:
         """TODO"""
-        bullet_file: Optional[Path] = None
-        bullet_line_number: Optional[int] = None
-
-        for path in iter_bullet_files(bullet.changelog_dir):
-            for i, line in enumerate(path.read_text().split("\n")):
-                if line == bullet.line:
-                    bullet_file = path
-                    bullet_line_number = i
-                    break
-
-        assert bullet_file is not None and bullet_line_number is not None, (
-            "Logic Error! How are we unable to find the bullet line in any"
-            f" file?\n\n    bullet={bullet}"
-        )
+        bullet_file = bullet.bullet_file
+        bullet_line_number = bullet.line_number
+        if bullet_file is None or bullet_line_number is None:
+            return Err(
+                f"The {self.__class__.__name__} changelog bullet tag can only"
+                " be used on bullets that were read from a bullet file:"
+                f" {bullet.line!r}"
+            )
 
-        out, _err = proctor.safe_popen(
-            ["git", "blame", str(bullet_file)]
-        ).unwrap()
-        blame_line = out.split("\n")[bullet_line_number]
+        blame_line = _git_blame(str(bullet_file))[bullet_line_number]
         blame_commit_hash = blame_line.split()[0]
 
         git_log_offset = int(self.tag[1:])
-        out, _err = proctor.safe_popen(
-            [
-                "git",
-                "log",
-                f"-{git_log_offset + 1}",
-                "--format=%h %H %s",
-                blame_commit_hash,
-            ]
-        ).unwrap()
-        log_line = out.split("\n")[-1]
+        log_line = _git_log(blame_commit_hash, git_log_offset + 1)[-1]
         short_hash, long_hash, *subject_list = log_line.split()
 
         if bullet.body == "...":
@@ -243,10 +244,23 @@ class RelativeCommitTag(TagMixin):
         return Ok(result)
 
 
+@lru_cache(maxsize=None)
+def _git_blame(path: str) -> List[str]:
+    out, _err = proctor.safe_popen(["git", "blame", path]).unwrap()
+    return out.split("\n")
+
+
+@lru_cache(maxsize=None)
+def _git_log(commit: str, n: int) -> List[str]:
+    out, _err = proctor.safe_popen(
+        ["git", "log", f"-{n}", "--format=%h %H %s", commit]
+    ).unwrap()
+    return out.split("\n")
+
+
 def _add_tag_to_paren_group(bullet_line: str, tag: str) -> str:
-    if m := re.match(r"^.*\((?P<tags>.*)\)$", bullet_line):
-        tags = m.group("tags")
-        return bullet_line.replace(f"({tags})", f"({tags + ', ' + tag})")
+    if bullet_line.endswith(")") and "(" in bullet_line:
+        return f"{bullet_line[:-1]}, {tag})"
     else:
         result = bullet_line + f" ({tag})"
         return result
@@ -41,10 +41,25 @@ All notable changes to this project will be documented in this file.
 ## Unreleased
 """
 
+# The unreleased section header is the very first line of this changelog.
+CONTENTS3 = """\
+## [Unreleased](https://github.com/bbugyi200/cldr/compare/0.9.9...HEAD)
+
+## [0.9.9](https://github.com/bbugyi200/cldr/compare/0.9.8...0.9.9) - 2021-08-08
+
+### Fixed
+
+* Fixed some bug.
+"""
+
 
 @params(
     "contents",
-    [param(CONTENTS1, id="contents1"), param(CONTENTS2, id="contents2")],
+    [
+        param(CONTENTS1, id="contents1"),
+        param(CONTENTS2, id="contents2"),
+        param(CONTENTS3, id="contents3"),
+    ],
 )
 @params(
     "bullet,ec",
@@ -60,6 +75,17 @@ All notable changes to this project will be documented in this file.
             0,
             id="change-some-feature",
         ),
+        # Tags that merely start with 'bc' are NOT breaking change tags.
+        param(
+            "* chg(bc-9): Changing some BC-9 feature.",
+            0,
+            id="bc-jira-issue",
+        ),
+        param(
+            "- rm(bc#5): Removing some bc#5 feature.",
+            0,
+            id="bc-repo-github-issue",
+        ),
         param("* addd: Added typo...", 1, id="add-typo"),
         param("* add(ak7k2): Bad jira issue...", 1, id="bad-jira-issue"),
         param("* No bullet kind...", 1, id="no-bullet-kind"),
@@ -106,3 +132,34 @@ def test_build(
         today.strftime("%Y-%m-%d"), "YYYY-MM-DD"
     )
     assert ec != 0 or changelog_contents == snapshot
+
+
+def test_build_readme_only(
+    changelog_dir: Path, default_config_file: ClackConfigFile
+) -> None:
+    """Test that 'build' fails when the changelog dir only has a README."""
+    changelog = changelog_dir.parent / "CHANGELOG.md"
+    changelog.write_text(CONTENTS1)
+
+    readme_file = changelog_dir / "README.md"
+    readme_file.write_text("# Changelog Bullets\n")
+
+    exit_code = cldr_main(
+        [
+            "",
+            "--config",
+            str(default_config_file.path),
+            "--changelog-dir",
+            str(changelog_dir),
+            "build",
+            "-V",
+            "1.0.0",
+            "--changelog",
+            str(changelog),
+            "-i",
+        ]
+    )
+
+    assert exit_code == 1
+    assert changelog.read_text() == CONTENTS1
+    assert readme_file.exists()
@@ -11,10 +11,13 @@ from pytest import mark
 from syrupy.assertion import SnapshotAssertion as Snapshot
 
 from cldr.__main__ import main as cldr_main
+from cldr._constants import BULLET_EXPLANATION, KIND_TO_SECTION_MAP
 
 
 params = mark.parametrize
 
+BULLET_FILE_NAME = "temp_bullet_file"
+
 
 @params(
     "bullets,args",
@@ -37,17 +40,20 @@ def test_new(
     args: Sequence[str],
 ) -> None:
     """Test the 'new' cldr subcommand"""
-    bullet_fname = "temp_bullet_file"
-    bullet_file_path = changelog_dir / f"{bullet_fname}.md"
+    bullet_file_path = changelog_dir / f"{BULLET_FILE_NAME}.md"
     if bullets:
-        bullet_file_path.write_text(
-            "\n".join(bullet for bullet in bullets) + "\n"
-        )
-
-    cmd_list = ["", "--changelog-dir", str(changelog_dir)]
-    cmd_list.append("new")
-    cmd_list.extend(["--no-commit", "--bullet-file-name", bullet_fname])
-    cmd_list.extend(args)
+        bullet_file_path.write_text("\n".join(bullets) + "\n")
+
+    cmd_list = [
+        "",
+        "--changelog-dir",
+        str(changelog_dir),
+        "new",
+        "--no-commit",
+        "--bullet-file-name",
+        BULLET_FILE_NAME,
+        *args,
+    ]
     cldr_main(cmd_list)
 
     assert bullet_file_path.read_text() == snapshot
@@ -57,8 +63,7 @@ def test_info(
     snapshot: Snapshot, capsys: CaptureFixture, changelog_dir: Path
 ) -> None:
     """Test the 'info' cldr subcommand"""
-    bullet_fname = "temp_bullet_file"
-    bullet_file_path = changelog_dir / f"{bullet_fname}.md"
+    bullet_file_path = changelog_dir / f"{BULLET_FILE_NAME}.md"
     bullet_file_path.write_text(
         "* add(123,!5): Add some new feature.\n"
         "* rm(!6,bc): Remove some old feature.\n"
@@ -72,3 +77,22 @@ def test_info(
         del info_dict["config"][key]
 
     assert info_dict == snapshot
+
+
+def test_bullet_explanation_kinds() -> None:
+    """Test that the KIND list hard-coded in BULLET_EXPLANATION is current."""
+    assert f"`{sorted(KIND_TO_SECTION_MAP)}`" in BULLET_EXPLANATION
+
+
+def test_info_no_changelog_dir(
+    capsys: CaptureFixture, changelog_dir: Path
+) -> None:
+    """Test the 'info' cldr subcommand when the changelog dir is missing."""
+    missing_changelog_dir = changelog_dir / "missing"
+
+    ec = cldr_main(["", "--changelog-dir", str(missing_changelog_dir), "info"])
+    captured = capsys.readouterr()
+    info_dict = json.loads(captured.out)
+
+    assert ec == 0
+    assert info_dict["bullets"] == []